@@ -5,12 +5,13 @@ Main entry point for the application
 
 import os
 import sys
-from pathlib import Path
 from dotenv import load_dotenv
 
-# Add project root to Python path
-project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
+# Add project root to Python path (guarded so re-imports don't stack duplicates);
+# plain os.path keeps pathlib out of the cold-start import cost
+_ROOT = os.path.dirname(os.path.abspath(__file__))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
 # Load environment variables
 load_dotenv()
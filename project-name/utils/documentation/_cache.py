@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Content-Addressed Result Cache
+Small on-disk cache used by the documentation tools to skip re-analyzing
+unchanged files. Entries are stored as .api_doc_cache/<key[:2]>/<key>.
+"""
+
+import os
+from pathlib import Path
+from typing import Optional
+
+_CACHE_DIR = Path('.api_doc_cache')
+
+
+def _entry_path(key: str) -> Path:
+    return _CACHE_DIR / key[:2] / key
+
+
+def get(key: str) -> Optional[bytes]:
+    """Return the cached payload for a key, or None on a miss."""
+    try:
+        return _entry_path(key).read_bytes()
+    except OSError:
+        return None
+
+
+def put(key: str, payload: bytes) -> None:
+    """Store a payload under a key. Failures are silently ignored."""
+    path = _entry_path(key)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write-then-rename so concurrent readers never see partial entries
+        tmp = path.with_name(f"{path.name}.tmp{os.getpid()}")
+        tmp.write_bytes(payload)
+        os.replace(tmp, path)
+    except OSError:
+        pass
@@ -30,231 +30,354 @@ Example:
     python utils/add_filepath_comments.py
 """
 
+import argparse
 import os
+import re
+import stat
 import sys
-import click
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import List, Set, Tuple, Optional
+
+# Matches a '#' comment line and captures its body, compiled once for all files
+_COMMENT_LINE_RE = re.compile(rb'^#\s*([^\r\n]*)')
+
+# Backslash normalization only ever does work on Windows; pick the branch
+# once at import instead of allocating a fresh string per file on POSIX
+if os.sep == '\\':
+    def _to_posix(path_str: str) -> str:
+        return path_str.replace('\\', '/')
+else:
+    def _to_posix(path_str: str) -> str:
+        return path_str
+
+
+# Directory names never descended into during traversal
+_DEFAULT_EXCLUDES = frozenset({
+    '__pycache__', '.git', '.venv', 'venv', 'env',
+    'build', 'dist', '.tox', 'htmlcov', '.pytest_cache',
+    '.mypy_cache', 'site-packages', '.idea', '.vscode',
+    'node_modules', '.claude'
+})
+
+
+@lru_cache(maxsize=None)
+def _relative_dir_prefix(parent: Path, root_dir: Path) -> Optional[str]:
+    """
+    Compute the relative directory prefix shared by all files in a folder.
+
+    The result is cached per directory so relative_to runs once per folder
+    instead of once per file.
+
+    Args:
+        parent: Directory containing the files
+        root_dir: Root directory of the project
+
+    Returns:
+        Prefix ending in '/' (or '' for the root itself), or None if the
+        directory is not under root_dir
+    """
+    try:
+        relative_dir = parent.relative_to(root_dir)
+    except ValueError:
+        return None
+    # Use forward slashes even on Windows for consistency
+    prefix = _to_posix(str(relative_dir))
+    return '' if prefix == '.' else prefix + '/'
 
 
 def get_relative_path_comment(file_path: Path, root_dir: Path) -> str:
     """
     Generate the relative filepath comment for a Python file.
-    
+
     Args:
         file_path: Path to the Python file
         root_dir: Root directory of the project
-        
+
     Returns:
         Comment string with relative path
     """
-    try:
-        relative_path = file_path.relative_to(root_dir)
-        # Use forward slashes even on Windows for consistency
-        relative_str = str(relative_path).replace('\\', '/')
-        return f"# {relative_str}\n"
-    except ValueError:
+    prefix = _relative_dir_prefix(file_path.parent, root_dir)
+    if prefix is None:
         # File is not under root_dir
         return f"# {file_path.name}\n"
+    return f"# {prefix}{file_path.name}\n"
+
+
+def _has_filepath_comment(first_line: bytes, expected_bytes: bytes) -> bool:
+    """
+    Check whether a first line already carries the filepath comment.
 
+    Args:
+        first_line: First line of the file as bytes
+        expected_bytes: Expected comment, stripped and UTF-8 encoded
+
+    Returns:
+        True if the line is the filepath comment or a variation of it
+    """
+    # Fast path: the overwhelmingly common case is an exact comment at the
+    # start of the line. bytes.startswith compares in place, so only the
+    # (tiny) trailing remainder is ever sliced.
+    if first_line.startswith(expected_bytes) and not first_line[len(expected_bytes):].strip():
+        return True
+
+    match = _COMMENT_LINE_RE.match(first_line.lstrip())
+    if match is None:
+        return False
 
-def needs_filepath_comment(file_path: Path, root_dir: Path) -> bool:
+    # The canonical path is already embedded in the expected comment, so no
+    # per-call relative_to work is needed here
+    relative_bytes = expected_bytes[1:].strip()
+    body = match.group(1).strip()
+
+    # Exact filepath comment, or a variation that still contains the path
+    return body == relative_bytes or relative_bytes in body
+
+
+def needs_filepath_comment(file_path: Path, filepath_comment: str) -> bool:
     """
     Check if a file needs a filepath comment added.
-    
+
     Args:
         file_path: Path to check
-        root_dir: Root directory of the project
-        
+        filepath_comment: Expected comment from get_relative_path_comment
+
     Returns:
         True if the file needs a filepath comment
     """
+    expected_bytes = filepath_comment.strip().encode('utf-8')
+
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            first_line = f.readline().strip()
-            
-        # Check if first line is already a filepath comment
-        expected_comment = get_relative_path_comment(file_path, root_dir).strip()
-        if first_line == expected_comment.strip():
-            return False
-            
-        # Also check if it's a variation of the filepath comment
-        relative_path = str(file_path.relative_to(root_dir)).replace('\\', '/')
-        if first_line.startswith("#") and relative_path in first_line:
-            return False
-            
-        return True
-        
+        # Read a bounded prefix in binary instead of decoding a whole line -
+        # the comparison only needs the first few dozen bytes
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            head = os.read(fd, max(256, len(expected_bytes) + 64))
+        finally:
+            os.close(fd)
+
+        return not _has_filepath_comment(head.split(b'\n', 1)[0], expected_bytes)
+
     except Exception:
         # If we can't read the file, assume it needs the comment
         return True
 
 
-def add_filepath_comment_to_file(file_path: Path, root_dir: Path, dry_run: bool = False) -> Tuple[bool, Optional[str]]:
+def add_filepath_comment_to_file(file_path: Path, filepath_comment: str,
+                                 dry_run: bool = False) -> Tuple[bool, Optional[str]]:
     """
     Add filepath comment to a single Python file.
-    
+
     Args:
         file_path: Path to the Python file
-        root_dir: Root directory of the project
+        filepath_comment: Precomputed comment from get_relative_path_comment
         dry_run: If True, don't actually modify the file
-        
+
     Returns:
         Tuple of (success, error_message)
     """
-    if not needs_filepath_comment(file_path, root_dir):
-        return True, "Already has filepath comment"
-        
-    filepath_comment = get_relative_path_comment(file_path, root_dir)
-    
+    # Encode once; the stripped form is what the first-line check compares
+    comment_bytes = filepath_comment.encode('utf-8')
+    expected_bytes = comment_bytes.strip()
+
     try:
-        # Read the entire file
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            
-        # Check if file starts with shebang
-        lines = content.splitlines(keepends=True)
-        if not lines:
+        # One stat serves both the empty-file shortcut and the permission
+        # bits carried over to the rewritten file
+        st = os.stat(file_path)
+
+        # Empty files (common for __init__.py) need no read at all
+        if st.st_size == 0:
+            content_bytes = b''
+        else:
+            # Read the entire file once - the "already commented" check runs
+            # against the in-memory content instead of a second open()
+            with open(file_path, 'rb') as f:
+                content_bytes = f.read()
+
+        if _has_filepath_comment(content_bytes.split(b'\n', 1)[0], expected_bytes):
+            return True, "Already has filepath comment"
+
+        # Splice the comment in at the bytes level - one find() for the
+        # shebang boundary and a join of a few slices, instead of splitting
+        # the whole file into per-line strings and rejoining
+        if not content_bytes:
             # Empty file
-            new_content = filepath_comment
-        elif lines[0].startswith("#!"):
+            out_bytes = comment_bytes
+        elif content_bytes.startswith(b"#!"):
             # File has shebang, insert comment after it
-            new_content = lines[0] + filepath_comment
-            if len(lines) > 1:
+            nl = content_bytes.find(b'\n') + 1
+            if nl == 0:
+                # Shebang line without trailing newline
+                out_bytes = content_bytes + comment_bytes
+            else:
+                rest = content_bytes[nl:]
                 # Add blank line if the next line isn't already blank
-                if lines[1].strip():
-                    new_content += "\n"
-                new_content += ''.join(lines[1:])
+                if rest and rest.split(b'\n', 1)[0].strip():
+                    out_bytes = b''.join([content_bytes[:nl], comment_bytes, b"\n", rest])
+                else:
+                    out_bytes = b''.join([content_bytes[:nl], comment_bytes, rest])
         else:
             # No shebang, add comment at the beginning
-            new_content = filepath_comment
             # Add blank line if the first line isn't already blank
-            if lines and lines[0].strip():
-                new_content += "\n"
-            new_content += content
-            
-        if dry_run:
-            click.echo(f"Would add to {file_path}: {filepath_comment.strip()}")
-        else:
-            # Write the modified content back
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(new_content)
-            click.echo(f"Added to {file_path}: {filepath_comment.strip()}")
-            
+            if content_bytes.split(b'\n', 1)[0].strip():
+                out_bytes = b''.join([comment_bytes, b"\n", content_bytes])
+            else:
+                out_bytes = comment_bytes + content_bytes
+
+        if not dry_run:
+            # Write the whole buffer with a single write() into a temp file,
+            # then os.replace for atomicity - readers never observe a
+            # partially written file
+            tmp_path = f"{file_path}.tmp{os.getpid()}"
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, out_bytes)
+                # fchmod, not the os.open mode, so the source permissions
+                # (e.g. the executable bit on scripts) survive the replace
+                # regardless of umask
+                os.fchmod(fd, stat.S_IMODE(st.st_mode))
+            finally:
+                os.close(fd)
+            os.replace(tmp_path, file_path)
+
         return True, None
-        
+
     except Exception as e:
-        error_msg = f"Error processing {file_path}: {str(e)}"
-        click.echo(f"ERROR: {error_msg}", err=True)
-        return False, error_msg
+        return False, f"Error processing {file_path}: {str(e)}"
+
+
+def _scandir_recursive(path: str, exclude_set: Set[str]):
+    """
+    Yield path strings of Python files under a directory using os.scandir.
+
+    Excluded directories are pruned before descending, so their contents
+    are never enumerated. DirEntry type checks reuse the stat information
+    returned by the directory read instead of issuing extra stat() calls.
+    An explicit stack keeps deep trees from stacking nested generators.
+    """
+    stack = [path]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in exclude_set:
+                            stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False) and entry.name.endswith('.py'):
+                        yield entry.path
+        except OSError:
+            # Unreadable directory - skip it, matching rglob's behavior
+            continue
 
 
-def find_python_files(root_dir: Path, exclude_dirs: Optional[List[str]] = None) -> List[Path]:
+def find_python_files(root_dir: Path, exclude_dirs: Optional[Set[str]] = None) -> List[Path]:
     """
     Find all Python files in the project directory.
-    
+
     Args:
         root_dir: Root directory to search
-        exclude_dirs: List of directory names to exclude
-        
+        exclude_dirs: Directory names to exclude (default: _DEFAULT_EXCLUDES)
+
     Returns:
         List of Python file paths
     """
-    if exclude_dirs is None:
-        exclude_dirs = [
-            '__pycache__', '.git', '.venv', 'venv', 'env',
-            'build', 'dist', '.tox', 'htmlcov', '.pytest_cache',
-            '.mypy_cache', 'site-packages', '.idea', '.vscode',
-            'node_modules', '.claude'
-        ]
-        
-    python_files = []
-    
-    for file_path in root_dir.rglob('*.py'):
-        # Check if file is in an excluded directory
-        if any(excluded in file_path.parts for excluded in exclude_dirs):
-            continue
-            
-        python_files.append(file_path)
-        
-    return sorted(python_files)
-
-
-@click.command()
-@click.option('--dry-run', is_flag=True, help='Preview changes without modifying files')
-@click.option('--root-dir', type=click.Path(exists=True, path_type=Path), default=Path.cwd(),
-              help='Root directory of the project (default: current directory)')
-@click.option('--exclude', multiple=True, help='Additional directories to exclude')
-def main(dry_run, root_dir, exclude):
-    """Add relative filepath comments to all Python files in the project.
-    
-    Examples:
-    
-      add_filepath_comments.py                    # Add filepath comments to all .py files
-    
-      add_filepath_comments.py --dry-run          # Preview changes without modifying files
-    
-      add_filepath_comments.py --root-dir ../     # Use parent directory as root
-    
-    The script will:
-    - Find all .py files in the project
-    - Skip files that already have filepath comments
-    - Add comments after shebangs if present
-    - Preserve all existing content
-    """
+    exclude_set = _DEFAULT_EXCLUDES if exclude_dirs is None else frozenset(exclude_dirs)
+
+    # Sort the raw path strings - str comparison is much cheaper than
+    # Path.__lt__, which normalizes the case of both sides per compare -
+    # then wrap in Path once for the deterministic final list
+    return [Path(p) for p in sorted(_scandir_recursive(str(root_dir), exclude_set))]
+
+
+def main():
+    """Add relative filepath comments to all Python files in the project."""
+    parser = argparse.ArgumentParser(
+        description='Add relative filepath comments to all Python files in the project.')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='Preview changes without modifying files')
+    parser.add_argument('--root-dir', type=Path, default=Path.cwd(),
+                        help='Root directory of the project (default: current directory)')
+    parser.add_argument('--exclude', action='append', default=[],
+                        help='Additional directories to exclude')
+    args = parser.parse_args()
+
     # Resolve root directory
-    root_dir = root_dir.resolve()
-        
-    click.echo(f"Project root: {root_dir}")
+    root_dir = args.root_dir.resolve()
+    if not root_dir.is_dir():
+        parser.error(f"Directory {root_dir} does not exist")
+    dry_run = args.dry_run
+
+    # Buffer all output and write it once at the end - one flush instead of
+    # a print per file, and no locking needed for the thread-pool workers
+    out_buf = [f"Project root: {root_dir}"]
     if dry_run:
-        click.echo("DRY RUN - No files will be modified")
-    click.echo()
-    
+        out_buf.append("DRY RUN - No files will be modified")
+    out_buf.append("")
+
     # Find all Python files
-    exclude_dirs = None
-    if exclude:
-        exclude_dirs = [
-            '__pycache__', '.git', '.venv', 'venv', 'env',
-            'build', 'dist', '.tox', 'htmlcov', '.pytest_cache',
-            '.mypy_cache', 'site-packages', '.idea', '.vscode',
-            'node_modules', '.claude'
-        ] + list(exclude)
-        
+    exclude_dirs = _DEFAULT_EXCLUDES | frozenset(args.exclude) if args.exclude else None
+
     python_files = find_python_files(root_dir, exclude_dirs)
-    
+
     if not python_files:
-        click.echo("No Python files found")
+        out_buf.append("No Python files found")
+        sys.stdout.write('\n'.join(out_buf) + '\n')
         return
-        
-    click.echo(f"Found {len(python_files)} Python files")
-    click.echo()
-    
+
+    out_buf.append(f"Found {len(python_files)} Python files")
+    out_buf.append("")
+
     # Process each file
     success_count = 0
     skip_count = 0
     error_count = 0
-    
-    for file_path in python_files:
-        success, error_msg = add_filepath_comment_to_file(file_path, root_dir, dry_run)
-        
-        if success:
-            if error_msg == "Already has filepath comment":
-                skip_count += 1
+    errors = []
+
+    # Each file is independent I/O-bound work, so overlap the syscall latency
+    # across a pool of threads
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Compute each file's comment once here and thread it through to the
+        # worker and the output message
+        futures = {}
+        for file_path in python_files:
+            comment = get_relative_path_comment(file_path, root_dir)
+            future = executor.submit(add_filepath_comment_to_file, file_path, comment, dry_run)
+            futures[future] = (file_path, comment)
+
+        # Consume in submission (sorted-path) order so the output is
+        # deterministic; result() blocks per future but the workers keep
+        # running ahead regardless of which one is awaited
+        for future, (file_path, comment) in futures.items():
+            success, error_msg = future.result()
+
+            if success:
+                if error_msg == "Already has filepath comment":
+                    skip_count += 1
+                else:
+                    success_count += 1
+                    verb = "Would add to" if dry_run else "Added to"
+                    out_buf.append(f"{verb} {file_path}: {comment.strip()}")
             else:
-                success_count += 1
-        else:
-            error_count += 1
-            
+                error_count += 1
+                errors.append(error_msg)
+
     # Print summary
-    click.echo()
-    click.echo("Summary:")
-    click.echo(f"  Files processed: {success_count}")
-    click.echo(f"  Files skipped (already have comment): {skip_count}")
-    click.echo(f"  Errors: {error_count}")
-    
+    out_buf.append("")
+    out_buf.append("Summary:")
+    out_buf.append(f"  Files processed: {success_count}")
+    out_buf.append(f"  Files skipped (already have comment): {skip_count}")
+    out_buf.append(f"  Errors: {error_count}")
+
     if dry_run:
-        click.echo("\nThis was a dry run. No files were modified.")
-        click.echo("Run without --dry-run to apply changes.")
+        out_buf.append("\nThis was a dry run. No files were modified.")
+        out_buf.append("Run without --dry-run to apply changes.")
+
+    sys.stdout.write('\n'.join(out_buf) + '\n')
+    if errors:
+        sys.stderr.write('\n'.join(f"ERROR: {msg}" for msg in errors) + '\n')
 
 
 if __name__ == "__main__":
@@ -5,18 +5,70 @@ Extracts FastAPI/Flask endpoints and generates documentation
 """
 
 import ast
+import hashlib
+import inspect
+import io
 import os
+import pickle
+import pickletools
 import sys
 import re
 import json
+try:
+    import orjson  # Much faster serializer; fall back to stdlib if absent
+except ImportError:
+    orjson = None
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Set, Optional, Tuple, Any
+from typing import Dict, List, NamedTuple, Set, Optional, Tuple, Any
 import click
 from collections import defaultdict
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 
+import _cache
 
-@dataclass
+# Below this many files the pool startup costs more than it saves
+_SERIAL_THRESHOLD = 8
+
+# Invalidates cached analysis results when the interpreter or this module
+# changes, since either can alter what the analyzer produces
+_CACHE_SALT = (
+    f"{sys.version_info[0]}.{sys.version_info[1]}:{os.path.getmtime(__file__)}".encode()
+)
+
+# Cheap bytes-level pre-filter: a file with none of these substrings cannot
+# define an endpoint, so ast.parse can be skipped entirely
+_ENDPOINT_NEEDLES = re.compile(
+    rb'@\w+\.(?:get|post|put|delete|patch|head|options|route)\b'
+    # Bare @route(...) with no instance, which the Flask analyzer accepts
+    rb'|@route\('
+    rb'|FastAPI\(|APIRouter\(|Flask\('
+)
+
+# Top-level module names that identify a web framework; doubles as the set
+# of names looked for in requirements files
+_FRAMEWORKS = frozenset({'fastapi', 'flask', 'django', 'starlette', 'aiohttp'})
+
+# Valid HTTP methods on route decorators and argument names that are never
+# endpoint parameters; frozensets give O(1) membership checks
+_HTTP_METHODS = frozenset({'GET', 'POST', 'PUT', 'DELETE', 'PATCH', 'HEAD', 'OPTIONS'})
+_SKIP_ARGS = frozenset({'self', 'cls'})
+
+# Constructor names that create app or router instances
+_CTOR_NAMES = frozenset({'FastAPI', 'APIRouter', 'Flask'})
+
+
+class ParamInfo(NamedTuple):
+    """One function parameter; a NamedTuple keeps per-param memory at a
+    fixed-size tuple instead of a dict per parameter."""
+    name: str
+    type: Optional[str] = None
+    default: Any = None
+    required: bool = True
+
+
+@dataclass(slots=True)
 class EndpointInfo:
     path: str
     method: str
@@ -24,7 +76,7 @@ class EndpointInfo:
     file_path: str
     line_number: int
     description: Optional[str] = None
-    parameters: List[Dict[str, Any]] = None
+    parameters: List[ParamInfo] = None
     response_model: Optional[str] = None
     status_code: Optional[int] = None
     tags: List[str] = None
@@ -37,230 +89,267 @@ class EndpointInfo:
             self.tags = []
 
 
-class APIAnalyzer(ast.NodeVisitor):
+class APIAnalyzer:
     def __init__(self, file_path: str, framework: str = "auto"):
-        self.file_path = file_path
+        # Every endpoint in a file shares one interned path object instead
+        # of aggregation holding duplicate strings per endpoint
+        self.file_path = sys.intern(file_path)
         self.framework = framework
         self.endpoints = []
-        self.current_class = None
         self.imports = {}
         self.routers = {}
         self.app_instances = set()
-        
-    def visit_Import(self, node):
+        # Frameworks this file imports or instantiates, collected during the
+        # same walk that finds endpoints
+        self.framework_hits = set()
+        # When the framework is known up front, bind the matching decorator
+        # analyzer so every decorator skips the other framework's checks
+        if framework == 'flask':
+            self._analyze_decorator = self._analyze_flask_decorator
+        elif framework in ('fastapi', 'starlette'):
+            self._analyze_decorator = self._analyze_fastapi_decorator
+
+    def analyze(self, tree):
+        """Walk the tree once with flat isinstance dispatch.
+
+        ast.walk iterates nodes from a deque instead of recursing through
+        NodeVisitor's per-node method lookup. Function defs are buffered and
+        their decorators analyzed after the walk, so routers register no
+        matter where in the file they are assigned.
+        """
+        func_nodes = []
+        for node in ast.walk(tree):
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                if node.decorator_list:
+                    func_nodes.append(node)
+            elif isinstance(node, ast.Assign):
+                self._handle_assign(node)
+            elif isinstance(node, ast.Import):
+                self._handle_import(node)
+            elif isinstance(node, ast.ImportFrom):
+                self._handle_import_from(node)
+
+        for func_node in func_nodes:
+            for decorator in func_node.decorator_list:
+                endpoint_info = self._analyze_decorator(decorator, func_node)
+                if endpoint_info:
+                    self.endpoints.append(endpoint_info)
+
+    def _handle_import(self, node):
         for alias in node.names:
             name = alias.asname if alias.asname else alias.name
             self.imports[name] = alias.name
-            
-    def visit_ImportFrom(self, node):
+            root = alias.name.partition('.')[0]
+            if root in _FRAMEWORKS:
+                self.framework_hits.add(root)
+
+    def _handle_import_from(self, node):
         for alias in node.names:
             name = alias.asname if alias.asname else alias.name
             module = node.module or ""
             self.imports[name] = f"{module}.{alias.name}"
-            
-    def visit_Assign(self, node):
-        # Detect app instances and routers
-        if isinstance(node.value, ast.Call):
-            if isinstance(node.value.func, ast.Name):
-                func_name = node.value.func.id
-                
-                # FastAPI app or router
-                if func_name in ['FastAPI', 'APIRouter']:
-                    for target in node.targets:
-                        if isinstance(target, ast.Name):
-                            if func_name == 'FastAPI':
-                                self.app_instances.add(target.id)
-                            else:
-                                self.routers[target.id] = self._extract_router_prefix(node.value)
-                                
-                # Flask app
-                elif func_name == 'Flask':
-                    for target in node.targets:
-                        if isinstance(target, ast.Name):
-                            self.app_instances.add(target.id)
-                            
-        self.generic_visit(node)
-        
-    def visit_ClassDef(self, node):
-        old_class = self.current_class
-        self.current_class = node.name
-        self.generic_visit(node)
-        self.current_class = old_class
-        
-    def visit_FunctionDef(self, node):
-        # Check decorators for route definitions
-        for decorator in node.decorator_list:
-            endpoint_info = self._analyze_decorator(decorator, node)
-            if endpoint_info:
-                self.endpoints.append(endpoint_info)
-                
-        self.generic_visit(node)
-        
+        root = (node.module or "").partition('.')[0]
+        if root in _FRAMEWORKS:
+            self.framework_hits.add(root)
+
+    def _handle_assign(self, node):
+        # Detect app instances and routers. The vast majority of assignments
+        # are not constructor calls, so bail out before any further work.
+        value = node.value
+        if (not isinstance(value, ast.Call)
+                or not isinstance(value.func, ast.Name)
+                or value.func.id not in _CTOR_NAMES):
+            return
+
+        func_name = value.func.id
+
+        # FastAPI app or router
+        if func_name != 'Flask':
+            self.framework_hits.add('fastapi')
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    if func_name == 'FastAPI':
+                        self.app_instances.add(target.id)
+                    else:
+                        self.routers[target.id] = self._extract_router_prefix(value)
+
+        # Flask app
+        else:
+            self.framework_hits.add('flask')
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    self.app_instances.add(target.id)
+
     def _extract_router_prefix(self, call_node) -> str:
         """Extract prefix from APIRouter() call."""
         for keyword in call_node.keywords:
             if keyword.arg == 'prefix':
                 if isinstance(keyword.value, ast.Constant):
                     return keyword.value.value
-                elif isinstance(keyword.value, ast.Str):
-                    return keyword.value.s
         return ""
         
     def _analyze_decorator(self, decorator, func_node) -> Optional[EndpointInfo]:
-        """Analyze decorator to extract endpoint information."""
-        method = None
-        path = None
+        """Combined analyzer used when the framework is not known up front."""
+        return (self._analyze_fastapi_decorator(decorator, func_node)
+                or self._analyze_flask_decorator(decorator, func_node))
+
+    def _analyze_fastapi_decorator(self, decorator, func_node) -> Optional[EndpointInfo]:
+        """Analyze @app.get("/path") / @router.post("/path") style decorators."""
+        if not (isinstance(decorator, ast.Call)
+                and isinstance(decorator.func, ast.Attribute)):
+            return None
+
+        method = decorator.func.attr.upper()
+
+        # Check if this is a valid HTTP method
+        if method not in _HTTP_METHODS:
+            return None
+
+        instance_name = None
+        if isinstance(decorator.func.value, ast.Name):
+            instance_name = decorator.func.value.id
+
+        # Extract path
+        path = self._get_string_value(decorator.args[0]) if decorator.args else None
+
         tags = []
         status_code = None
         response_model = None
         deprecated = False
-        
-        # Handle different decorator patterns
-        if isinstance(decorator, ast.Call):
-            # @app.get("/path") or @router.post("/path")
-            if isinstance(decorator.func, ast.Attribute):
-                instance_name = None
-                if isinstance(decorator.func.value, ast.Name):
-                    instance_name = decorator.func.value.id
-                    
-                method = decorator.func.attr.upper()
-                
-                # Check if this is a valid HTTP method
-                if method in ['GET', 'POST', 'PUT', 'DELETE', 'PATCH', 'HEAD', 'OPTIONS']:
-                    # Extract path
-                    if decorator.args:
-                        path = self._get_string_value(decorator.args[0])
-                        
-                    # Extract additional parameters from keywords
-                    for keyword in decorator.keywords:
-                        if keyword.arg == 'tags' and isinstance(keyword.value, ast.List):
-                            tags = [self._get_string_value(elt) for elt in keyword.value.elts]
-                        elif keyword.arg == 'status_code':
-                            status_code = self._get_int_value(keyword.value)
-                        elif keyword.arg == 'response_model':
-                            response_model = self._get_name_value(keyword.value)
-                        elif keyword.arg == 'deprecated':
-                            deprecated = self._get_bool_value(keyword.value)
-                            
-                    # Add router prefix if applicable
-                    if instance_name in self.routers and path:
-                        prefix = self.routers[instance_name]
-                        if prefix and not path.startswith(prefix):
-                            path = prefix + path
-                            
-            # Flask @app.route decorator
-            elif isinstance(decorator.func, ast.Name) and decorator.func.id == 'route':
-                if decorator.args:
-                    path = self._get_string_value(decorator.args[0])
-                    # Extract methods from keywords
-                    for keyword in decorator.keywords:
-                        if keyword.arg == 'methods' and isinstance(keyword.value, ast.List):
-                            methods = [self._get_string_value(elt) for elt in keyword.value.elts]
-                            method = methods[0] if methods else 'GET'
-                            
-        # Handle simple decorators like @deprecated
-        elif isinstance(decorator, ast.Name):
-            if decorator.id == 'deprecated':
-                deprecated = True
-                
+
+        # Extract additional parameters from keywords
+        for keyword in decorator.keywords:
+            if keyword.arg == 'tags' and isinstance(keyword.value, ast.List):
+                tags = [self._get_string_value(elt) for elt in keyword.value.elts]
+            elif keyword.arg == 'status_code':
+                status_code = self._get_int_value(keyword.value)
+            elif keyword.arg == 'response_model':
+                response_model = self._get_name_value(keyword.value)
+            elif keyword.arg == 'deprecated':
+                deprecated = self._get_bool_value(keyword.value)
+
+        # Add router prefix if applicable
+        if instance_name in self.routers and path:
+            prefix = self.routers[instance_name]
+            if prefix and not path.startswith(prefix):
+                path = prefix + path
+
+        if path:
+            return self._make_endpoint(path, method, func_node, tags,
+                                       status_code, response_model, deprecated)
+        return None
+
+    def _analyze_flask_decorator(self, decorator, func_node) -> Optional[EndpointInfo]:
+        """Analyze Flask @route("/path", methods=[...]) decorators."""
+        if not (isinstance(decorator, ast.Call)
+                and isinstance(decorator.func, ast.Name)
+                and decorator.func.id == 'route'
+                and decorator.args):
+            return None
+
+        path = self._get_string_value(decorator.args[0])
+        method = None
+
+        # Extract methods from keywords
+        for keyword in decorator.keywords:
+            if keyword.arg == 'methods' and isinstance(keyword.value, ast.List):
+                methods = [self._get_string_value(elt) for elt in keyword.value.elts]
+                method = methods[0] if methods else 'GET'
+
         if path and method:
-            # Extract function documentation
-            description = ast.get_docstring(func_node)
-            
-            # Extract parameters
-            parameters = self._extract_parameters(func_node)
-            
-            return EndpointInfo(
-                path=path,
-                method=method,
-                function_name=func_node.name,
-                file_path=self.file_path,
-                line_number=func_node.lineno,
-                description=description,
-                parameters=parameters,
-                response_model=response_model,
-                status_code=status_code,
-                tags=tags,
-                deprecated=deprecated
-            )
-            
+            return self._make_endpoint(path, method, func_node, [],
+                                       None, None, False)
         return None
+
+    def _make_endpoint(self, path, method, func_node, tags,
+                       status_code, response_model, deprecated) -> EndpointInfo:
+        # Methods and tags repeat across most endpoints; interning
+        # collapses the duplicates to shared string objects
+        return EndpointInfo(
+            path=path,
+            method=sys.intern(method),
+            function_name=func_node.name,
+            file_path=self.file_path,
+            line_number=func_node.lineno,
+            description=self._get_docstring(func_node),
+            parameters=self._extract_parameters(func_node),
+            response_model=response_model,
+            status_code=status_code,
+            tags=[sys.intern(t) if isinstance(t, str) else t for t in tags],
+            deprecated=deprecated
+        )
         
-    def _extract_parameters(self, func_node) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _get_docstring(func_node) -> Optional[str]:
+        """Extract a function docstring without ast.get_docstring overhead.
+
+        Checks the first body statement directly and only runs cleandoc when
+        there is a docstring to clean - the common undocumented case costs
+        two isinstance checks.
+        """
+        body = func_node.body
+        if not body:
+            return None
+        first = body[0]
+        if isinstance(first, ast.Expr):
+            value = first.value
+            if isinstance(value, ast.Constant) and isinstance(value.value, str):
+                return inspect.cleandoc(value.value)
+        return None
+
+    def _extract_parameters(self, func_node) -> List[ParamInfo]:
         """Extract function parameters and their types."""
         parameters = []
-        
+
         for arg in func_node.args.args:
-            if arg.arg not in ['self', 'cls']:
-                param = {
-                    'name': arg.arg,
-                    'type': None,
-                    'default': None,
-                    'required': True
-                }
-                
-                # Extract type annotation
-                if arg.annotation:
-                    param['type'] = self._get_annotation_string(arg.annotation)
-                    
-                parameters.append(param)
-                
+            if arg.arg not in _SKIP_ARGS:
+                annotation = (self._get_annotation_string(arg.annotation)
+                              if arg.annotation else None)
+                parameters.append(ParamInfo(name=arg.arg, type=annotation))
+
         # Check for default values
         defaults_start = len(func_node.args.args) - len(func_node.args.defaults)
         for i, default in enumerate(func_node.args.defaults):
             param_index = defaults_start + i
             if param_index < len(parameters):
-                parameters[param_index]['default'] = self._get_default_value(default)
-                parameters[param_index]['required'] = False
-                
+                parameters[param_index] = parameters[param_index]._replace(
+                    default=self._get_default_value(default), required=False)
+
         return parameters
         
     def _get_string_value(self, node) -> Optional[str]:
         """Extract string value from AST node."""
         if isinstance(node, ast.Constant) and isinstance(node.value, str):
             return node.value
-        elif isinstance(node, ast.Str):
-            return node.s
         return None
-        
+
     def _get_int_value(self, node) -> Optional[int]:
         """Extract integer value from AST node."""
         if isinstance(node, ast.Constant) and isinstance(node.value, int):
             return node.value
-        elif isinstance(node, ast.Num):
-            return node.n
         return None
-        
+
     def _get_bool_value(self, node) -> bool:
         """Extract boolean value from AST node."""
         if isinstance(node, ast.Constant):
             return bool(node.value)
-        elif isinstance(node, ast.NameConstant):
-            return bool(node.value)
         return False
         
     def _get_name_value(self, node) -> Optional[str]:
         """Extract name from AST node."""
-        if isinstance(node, ast.Name):
-            return node.id
-        elif isinstance(node, ast.Attribute):
-            return f"{self._get_name_value(node.value)}.{node.attr}"
+        if isinstance(node, (ast.Name, ast.Attribute)):
+            return ast.unparse(node)
         return None
-        
+
     def _get_annotation_string(self, node) -> str:
         """Convert annotation AST node to string."""
-        if isinstance(node, ast.Name):
-            return node.id
-        elif isinstance(node, ast.Subscript):
-            value = self._get_annotation_string(node.value)
-            slice_value = self._get_annotation_string(node.slice)
-            return f"{value}[{slice_value}]"
-        elif isinstance(node, ast.Attribute):
-            value = self._get_annotation_string(node.value)
-            return f"{value}.{node.attr}"
-        elif isinstance(node, ast.Constant):
-            return repr(node.value)
-        return "Any"
+        # ast.unparse handles every annotation shape (subscripts, unions,
+        # string literals, ...) in C-accelerated code; the recursive
+        # hand-rolled version only covered a few of them
+        try:
+            return ast.unparse(node)
+        except Exception:
+            return "Any"
         
     def _get_default_value(self, node) -> Any:
         """Extract default value from AST node."""
@@ -275,83 +364,126 @@ class APIAnalyzer(ast.NodeVisitor):
         return None
 
 
-def detect_framework(root_dir: Path) -> str:
-    """Detect which web framework is being used."""
-    # Check imports in Python files
-    framework_indicators = {
-        'fastapi': ['from fastapi', 'import fastapi', 'FastAPI('],
-        'flask': ['from flask', 'import flask', 'Flask('],
-        'django': ['from django', 'import django', 'django.urls'],
-        'starlette': ['from starlette', 'import starlette'],
-        'aiohttp': ['from aiohttp', 'import aiohttp'],
-    }
-    
-    framework_scores = defaultdict(int)
-    
-    for py_file in root_dir.rglob('*.py'):
-        try:
-            with open(py_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
-            for framework, indicators in framework_indicators.items():
-                for indicator in indicators:
-                    if indicator in content:
-                        framework_scores[framework] += 1
-                        
-        except:
-            pass
-            
-    # Check requirements files
+def _score_requirements(root_dir: Path, framework_scores: Dict[str, int]) -> None:
+    """Add framework scores from requirements files into framework_scores."""
     req_files = list(root_dir.glob('requirements*.txt')) + [root_dir / 'pyproject.toml']
     for req_file in req_files:
         if req_file.exists():
             try:
                 with open(req_file, 'r', encoding='utf-8') as f:
                     content = f.read().lower()
-                    
-                for framework in framework_indicators:
+
+                for framework in _FRAMEWORKS:
                     if framework in content:
                         framework_scores[framework] += 5
-                        
+
             except:
                 pass
-                
-    if framework_scores:
-        return max(framework_scores, key=framework_scores.get)
-        
-    return 'unknown'
 
 
-def analyze_api_files(root_dir: Path, framework: str = "auto", 
+def _iter_python_files(root: str, exclude_dirs: frozenset):
+    """Yield Python file paths under root, pruning excluded directories.
+
+    Pruning happens before descent, so excluded trees (virtualenvs,
+    node_modules, ...) are never enumerated at all - unlike rglob, which
+    lists everything and filters afterwards.
+    """
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in exclude_dirs:
+                            stack.append(entry.path)
+                    elif entry.name.endswith('.py') and entry.is_file(follow_symlinks=False):
+                        yield entry.path
+        except OSError:
+            continue
+
+
+def _analyze_one(path_str: str, framework: str) -> Tuple[List[EndpointInfo], frozenset, Optional[str], bool]:
+    """Analyze a single file; returns (endpoints, framework_hits, error_message, cache_hit)."""
+    try:
+        with open(path_str, 'rb') as f:
+            content_bytes = f.read()
+
+        # Results are cached by content hash, so unchanged files skip both
+        # ast.parse and the analyzer walk entirely on repeat runs. The path
+        # is part of the key because endpoints record their source file.
+        key = hashlib.sha256(
+            content_bytes + _CACHE_SALT + framework.encode() + path_str.encode()
+        ).hexdigest()
+        cached = _cache.get(key)
+        if cached is not None:
+            endpoints, hits = pickle.loads(cached)
+            return endpoints, hits, None, True
+
+        # Most project files define no endpoints at all; one regex scan of
+        # the raw bytes is far cheaper than parsing and walking their AST
+        if _ENDPOINT_NEEDLES.search(content_bytes) is None:
+            _cache.put(key, pickletools.optimize(pickle.dumps(([], frozenset()))))
+            return [], frozenset(), None, False
+
+        # ast.parse accepts bytes and decodes per the file's own coding
+        # declaration, skipping the intermediate str copy
+        tree = ast.parse(content_bytes)
+        analyzer = APIAnalyzer(path_str, framework)
+        analyzer.analyze(tree)
+
+        hits = frozenset(analyzer.framework_hits)
+        _cache.put(key, pickletools.optimize(pickle.dumps((analyzer.endpoints, hits))))
+        return analyzer.endpoints, hits, None, False
+
+    except Exception as e:
+        return [], frozenset(), f"Error analyzing {path_str}: {e}", False
+
+
+def analyze_api_files(root_dir: Path, framework: str = "auto",
                      exclude_dirs: Optional[Set[str]] = None) -> List[EndpointInfo]:
     """Analyze all Python files for API endpoints."""
     if exclude_dirs is None:
-        exclude_dirs = {'.venv', 'venv', 'env', '__pycache__', '.git', 
+        exclude_dirs = {'.venv', 'venv', 'env', '__pycache__', '.git',
                        'build', 'dist', '.tox', 'node_modules'}
-    
-    if framework == "auto":
-        framework = detect_framework(root_dir)
-        click.echo(f"Detected framework: {framework}", err=True)
-        
+
+    files = sorted(_iter_python_files(str(root_dir), frozenset(exclude_dirs)))
+
     all_endpoints = []
-    
-    for py_file in root_dir.rglob('*.py'):
-        if any(excluded in py_file.parts for excluded in exclude_dirs):
-            continue
-            
-        try:
-            with open(py_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
-            tree = ast.parse(content)
-            analyzer = APIAnalyzer(str(py_file), framework)
-            analyzer.visit(tree)
-            
-            all_endpoints.extend(analyzer.endpoints)
-            
-        except Exception as e:
-            click.echo(f"Error analyzing {py_file}: {e}", err=True)
-            
+
+    # Per-file parsing is CPU-bound and independent, so fan out across
+    # processes; small file counts stay serial to skip pool startup
+    analyze = partial(_analyze_one, framework=framework)
+    if len(files) < _SERIAL_THRESHOLD:
+        results = [analyze(f) for f in files]
+    else:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = list(executor.map(analyze, files, chunksize=16))
+
+    framework_scores = defaultdict(int)
+    hits = misses = 0
+    for endpoints, framework_hits, error, cache_hit in results:
+        if error:
+            click.echo(error, err=True)
+        else:
+            all_endpoints.extend(endpoints)
+            for hit in framework_hits:
+                framework_scores[hit] += 1
+            if cache_hit:
+                hits += 1
+            else:
+                misses += 1
+
+    # Framework detection reuses the import/constructor evidence gathered
+    # during the analysis walk instead of re-reading every file
+    if framework == "auto":
+        _score_requirements(root_dir, framework_scores)
+        detected = (max(framework_scores, key=framework_scores.get)
+                    if framework_scores else 'unknown')
+        click.echo(f"Detected framework: {detected}", err=True)
+
+    click.echo(f"Analysis cache: {hits} hits, {misses} misses", err=True)
+
     return all_endpoints
 
 
@@ -371,43 +503,38 @@ def generate_openapi_spec(endpoints: List[EndpointInfo], project_name: str = "AP
         "tags": []
     }
     
-    # Collect all unique tags
-    all_tags = set()
-    for endpoint in endpoints:
-        all_tags.update(endpoint.tags)
-        
+    # Collect all unique tags in one set union
+    all_tags = set().union(*(endpoint.tags for endpoint in endpoints)) if endpoints else set()
     openapi["tags"] = [{"name": tag} for tag in sorted(all_tags)]
-    
+
     # Group endpoints by path
     paths = defaultdict(dict)
-    
+
     for endpoint in endpoints:
         method = endpoint.method.lower()
-        
+
         operation = {
             "operationId": endpoint.function_name,
             "summary": endpoint.function_name.replace('_', ' ').title(),
             "tags": endpoint.tags,
             "deprecated": endpoint.deprecated
         }
-        
+
         if endpoint.description:
             operation["description"] = endpoint.description
-            
+
         # Add parameters
         if endpoint.parameters:
-            operation["parameters"] = []
-            for param in endpoint.parameters:
-                param_spec = {
-                    "name": param["name"],
+            operation["parameters"] = [
+                {
+                    "name": param.name,
                     "in": "query",  # Simplified - would need more analysis
-                    "required": param["required"],
-                    "schema": {"type": "string"}  # Simplified
+                    "required": param.required,
+                    "schema": {"type": _map_python_type_to_openapi(param.type)
+                               if param.type else "string"}  # Simplified
                 }
-                if param["type"]:
-                    param_spec["schema"]["type"] = _map_python_type_to_openapi(param["type"])
-                    
-                operation["parameters"].append(param_spec)
+                for param in endpoint.parameters
+            ]
                 
         # Add response
         operation["responses"] = {
@@ -445,76 +572,107 @@ def _map_python_type_to_openapi(python_type: str) -> str:
 
 def generate_markdown_docs(endpoints: List[EndpointInfo], root_dir: Path) -> str:
     """Generate Markdown documentation for endpoints."""
-    doc = []
-    doc.append("# API Documentation")
-    doc.append("")
-    
+    # A StringIO accumulates the document in one growable buffer instead of
+    # a list of thousands of line fragments joined at the end
+    buf = io.StringIO()
+    write = buf.write
+    write("# API Documentation\n\n")
+
+    # Endpoints in the same file share one relative_to computation
+    rel_paths: Dict[str, Path] = {}
+
     # Group endpoints by tags
     tagged_endpoints = defaultdict(list)
     untagged_endpoints = []
-    
+
     for endpoint in endpoints:
         if endpoint.tags:
             for tag in endpoint.tags:
                 tagged_endpoints[tag].append(endpoint)
         else:
             untagged_endpoints.append(endpoint)
-            
+
     # Document tagged endpoints
     for tag in sorted(tagged_endpoints.keys()):
-        doc.append(f"## {tag}")
-        doc.append("")
-        
+        write(f"## {tag}\n\n")
+
         for endpoint in sorted(tagged_endpoints[tag], key=lambda e: (e.path, e.method)):
-            _add_endpoint_to_doc(doc, endpoint, root_dir)
-            
+            _add_endpoint_to_doc(write, endpoint, root_dir, rel_paths)
+
     # Document untagged endpoints
     if untagged_endpoints:
-        doc.append("## Other Endpoints")
-        doc.append("")
-        
+        write("## Other Endpoints\n\n")
+
         for endpoint in sorted(untagged_endpoints, key=lambda e: (e.path, e.method)):
-            _add_endpoint_to_doc(doc, endpoint, root_dir)
-            
-    return "\n".join(doc)
+            _add_endpoint_to_doc(write, endpoint, root_dir, rel_paths)
+
+    # Collapse the trailing blank line, matching the old join() output
+    return buf.getvalue().rstrip('\n') + '\n'
 
 
-def _add_endpoint_to_doc(doc: List[str], endpoint: EndpointInfo, root_dir: Path):
-    """Add a single endpoint to the documentation."""
+def _add_endpoint_to_doc(write, endpoint: EndpointInfo, root_dir: Path,
+                         rel_paths: Dict[str, Path]):
+    """Write a single endpoint to the documentation buffer."""
     # Header
     deprecated = " ⚠️ **DEPRECATED**" if endpoint.deprecated else ""
-    doc.append(f"### {endpoint.method} {endpoint.path}{deprecated}")
-    doc.append("")
-    
+    write(f"### {endpoint.method} {endpoint.path}{deprecated}\n\n")
+
     # Description
     if endpoint.description:
-        doc.append(endpoint.description)
-        doc.append("")
-        
+        write(endpoint.description)
+        write("\n\n")
+
     # Implementation details
-    rel_path = Path(endpoint.file_path).relative_to(root_dir)
-    doc.append(f"**Function**: `{endpoint.function_name}` in `{rel_path}:{endpoint.line_number}`")
-    doc.append("")
-    
+    rel_path = rel_paths.get(endpoint.file_path)
+    if rel_path is None:
+        rel_path = Path(endpoint.file_path).relative_to(root_dir)
+        rel_paths[endpoint.file_path] = rel_path
+    write(f"**Function**: `{endpoint.function_name}` in `{rel_path}:{endpoint.line_number}`\n\n")
+
     # Parameters
     if endpoint.parameters:
-        doc.append("**Parameters**:")
-        doc.append("")
+        write("**Parameters**:\n\n")
         for param in endpoint.parameters:
-            required = "required" if param["required"] else "optional"
-            param_type = param["type"] or "any"
-            default = f" = {param['default']}" if param["default"] is not None else ""
-            doc.append(f"- `{param['name']}` ({param_type}, {required}){default}")
-        doc.append("")
-        
+            required = "required" if param.required else "optional"
+            param_type = param.type or "any"
+            default = f" = {param.default}" if param.default is not None else ""
+            write(f"- `{param.name}` ({param_type}, {required}){default}\n")
+        write("\n")
+
     # Response
     status = endpoint.status_code or 200
-    doc.append(f"**Response**: {status}")
+    write(f"**Response**: {status}\n")
     if endpoint.response_model:
-        doc.append(f"- Model: `{endpoint.response_model}`")
-    doc.append("")
-    doc.append("---")
-    doc.append("")
+        write(f"- Model: `{endpoint.response_model}`\n")
+    write("\n---\n\n")
+
+
+def _endpoint_to_dict(endpoint: EndpointInfo) -> Dict[str, Any]:
+    """Plain-dict form of an endpoint for serialization.
+
+    Builds the dict directly instead of dataclasses.asdict, which deep-copies
+    every field through a recursive type dispatch.
+    """
+    return {
+        'path': endpoint.path,
+        'method': endpoint.method,
+        'function_name': endpoint.function_name,
+        'file_path': endpoint.file_path,
+        'line_number': endpoint.line_number,
+        'description': endpoint.description,
+        'parameters': [p._asdict() for p in endpoint.parameters],
+        'response_model': endpoint.response_model,
+        'status_code': endpoint.status_code,
+        'tags': endpoint.tags,
+        'deprecated': endpoint.deprecated,
+    }
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize to indented JSON, via orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(obj, indent=2)
 
 
 def find_undocumented_endpoints(endpoints: List[EndpointInfo]) -> List[EndpointInfo]:
@@ -522,38 +680,30 @@ def find_undocumented_endpoints(endpoints: List[EndpointInfo]) -> List[EndpointI
     return [e for e in endpoints if not e.description]
 
 
-@click.command()
-@click.argument('path', default='.', type=click.Path(exists=True))
-@click.option('--format', 'output_format', type=click.Choice(['markdown', 'openapi', 'json', 'summary']),
-              default='markdown', help='Output format')
-@click.option('--output', '-o', type=click.Path(), help='Output file (default: stdout)')
-@click.option('--framework', type=click.Choice(['auto', 'fastapi', 'flask', 'django']),
-              default='auto', help='Web framework to analyze')
-@click.option('--project-name', default='API', help='Project name for documentation')
-def main(path, output_format, output, framework, project_name):
-    """Generate API documentation."""
-    root_dir = Path(path).resolve()
-        
+def _generate_for_root(root_dir: Path, output_format: str, framework: str,
+                       project_name: str) -> Optional[Any]:
+    """Analyze one project root and render it in the requested format.
+
+    Text formats return the rendered string; the JSON formats (openapi,
+    json) return the serializable document so main can combine several
+    roots into one valid JSON output instead of concatenating documents.
+    """
     # Analyze API files
     click.echo(f"Analyzing API endpoints in {root_dir}...", err=True)
     endpoints = analyze_api_files(root_dir, framework)
-    
+
     if not endpoints:
         click.echo("No API endpoints found.", err=True)
-        sys.exit(0)
-        
+        return None
+
     click.echo(f"Found {len(endpoints)} endpoints", err=True)
-    
-    # Generate output based on format
-    output = ""
-    
+
     if output_format == "markdown":
         output_content = generate_markdown_docs(endpoints, root_dir)
     elif output_format == "openapi":
-        spec = generate_openapi_spec(endpoints, project_name)
-        output_content = json.dumps(spec, indent=2)
+        output_content = generate_openapi_spec(endpoints, project_name)
     elif output_format == "json":
-        output_content = json.dumps([asdict(e) for e in endpoints], indent=2)
+        output_content = [_endpoint_to_dict(e) for e in endpoints]
     elif output_format == "summary":
         # Generate summary
         undocumented = find_undocumented_endpoints(endpoints)
@@ -584,7 +734,47 @@ def main(path, output_format, output, framework, project_name):
                 summary.append(f"  {e.method} {e.path} ({rel_path}:{e.line_number})")
                 
         output_content = "\n".join(summary)
-        
+
+    return output_content
+
+
+@click.command()
+@click.argument('paths', nargs=-1, type=click.Path(exists=True))
+@click.option('--format', 'output_format', type=click.Choice(['markdown', 'openapi', 'json', 'summary']),
+              default='markdown', help='Output format')
+@click.option('--output', '-o', type=click.Path(), help='Output file (default: stdout)')
+@click.option('--framework', type=click.Choice(['auto', 'fastapi', 'flask', 'django']),
+              default='auto', help='Web framework to analyze')
+@click.option('--project-name', default='API', help='Project name for documentation')
+def main(paths, output_format, output, framework, project_name):
+    """Generate API documentation for one or more project roots.
+
+    Passing several paths processes them in a single invocation, so import
+    costs, compiled patterns, and the on-disk analysis cache are paid once
+    instead of once per project.
+    """
+    root_dirs = [Path(p).resolve() for p in paths] if paths else [Path('.').resolve()]
+
+    documents = []
+    for root_dir in root_dirs:
+        content = _generate_for_root(root_dir, output_format, framework, project_name)
+        if content is not None:
+            documents.append((root_dir, content))
+
+    if not documents:
+        sys.exit(0)
+
+    if output_format in ('openapi', 'json'):
+        # Always one valid JSON document: a single root's document as-is,
+        # or a top-level {root: document} object for several roots -
+        # joining serialized documents would not parse
+        if len(documents) == 1:
+            output_content = _dumps(documents[0][1])
+        else:
+            output_content = _dumps({str(root): doc for root, doc in documents})
+    else:
+        output_content = "\n".join(doc for _, doc in documents)
+
     # Output results
     if output:
         with open(output, 'w') as f:
@@ -8,8 +8,9 @@ import os
 import sys
 import re
 import subprocess
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple, Set
+from typing import Iterable, Iterator, List, Dict, Optional, Tuple, Set
 from datetime import datetime
 from collections import defaultdict
 import click
@@ -17,6 +18,18 @@ import json
 from dataclasses import dataclass, field
 
 
+def _newline_separated(lines: Iterable[str]) -> Iterator[str]:
+    """Yield lines interleaved with newlines, matching '\\n'.join() output."""
+    it = iter(lines)
+    try:
+        yield next(it)
+    except StopIteration:
+        return
+    for line in it:
+        yield '\n'
+        yield line
+
+
 @dataclass
 class Commit:
     sha: str
@@ -32,28 +45,40 @@ class Commit:
     issues: List[str] = field(default_factory=list)
     
     
+# Conventional commit pattern: type(scope): description. Only ever
+# .match-ed against the single header line, so no ^ anchor or
+# re.MULTILINE newline tracking is needed.
+_COMMIT_PATTERN = re.compile(
+    r'(?P<type>\w+)(?:\((?P<scope>[\w\-\.]+)\))?\s*:\s*(?P<description>.+)$'
+)
+
+# Breaking-change footers and issue references fused into one alternation
+# so each message is scanned once instead of once per pattern. Flags are
+# scoped per alternative: the JIRA/ISSUE style stays case-sensitive while
+# the rest are case-insensitive, matching the original separate patterns.
+_COMBINED_PATTERN = re.compile('|'.join((
+    # BREAKING CHANGE: ... / BREAKING: ... at the start of a line
+    # ([^\S\n] keeps the whitespace run on the same line)
+    r'(?im:^BREAKING(?: CHANGE)?:[^\S\n]*(?P<breaking>.+))',
+    r'(?i:(?:fixes|closes|resolves)\s+#(?P<issue_verb>\d+))',
+    r'#(?P<issue_hash>\d+)',  # GitHub style: #123
+    r'(?:JIRA|ISSUE)-(?P<issue_jira>\d+)',  # JIRA style
+    r'(?i:(?:fix|close|resolve)\s+(?:issue\s+)?(?P<issue_word>\d+))',
+)))
+
+# Every alternative in _COMBINED_PATTERN requires one of these substrings
+# (case-insensitively), so a message containing none of them - the common
+# case for plain 'feat: add x' commits - can skip the regex scan outright.
+_COMBINED_GATE_LITERALS = ('#', 'breaking', 'fix', 'close', 'resolve', 'jira-', 'issue')
+
+
 class ConventionalCommitParser:
     """Parse commits following Conventional Commits specification."""
-    
-    # Conventional commit pattern: type(scope): description
-    COMMIT_PATTERN = re.compile(
-        r'^(?P<type>\w+)(?:\((?P<scope>[\w\-\.]+)\))?\s*:\s*(?P<description>.+)$',
-        re.MULTILINE
-    )
-    
-    # Issue reference patterns
-    ISSUE_PATTERNS = [
-        re.compile(r'#(\d+)'),  # GitHub style: #123
-        re.compile(r'(?:fixes|closes|resolves)\s+#(\d+)', re.IGNORECASE),
-        re.compile(r'(?:JIRA|ISSUE)-(\d+)'),  # JIRA style
-        re.compile(r'(?:fix|close|resolve)\s+(?:issue\s+)?(\d+)', re.IGNORECASE),
-    ]
-    
-    # Breaking change patterns
-    BREAKING_PATTERNS = [
-        re.compile(r'BREAKING CHANGE:\s*(.+)', re.IGNORECASE),
-        re.compile(r'BREAKING:\s*(.+)', re.IGNORECASE),
-    ]
+
+    # Aliases of the module-level constants; parse() reads the globals
+    # directly to skip the per-commit attribute lookups
+    COMMIT_PATTERN = _COMMIT_PATTERN
+    COMBINED_PATTERN = _COMBINED_PATTERN
     
     # Valid commit types and their display names
     COMMIT_TYPES = {
@@ -69,6 +94,9 @@ class ConventionalCommitParser:
         'chore': 'Chores',
         'revert': 'Reverts',
     }
+
+    # Membership checks go through the frozenset rather than the dict
+    COMMIT_TYPE_SET = frozenset(COMMIT_TYPES)
     
     def parse(self, sha: str, message: str, author: str, date: datetime) -> Optional[Commit]:
         """Parse a commit message into a Commit object."""
@@ -77,7 +105,7 @@ class ConventionalCommitParser:
             return None
             
         # Parse the first line
-        match = self.COMMIT_PATTERN.match(lines[0])
+        match = _COMMIT_PATTERN.match(lines[0])
         if not match:
             # Not a conventional commit
             return None
@@ -94,110 +122,289 @@ class ConventionalCommitParser:
         
         # Parse body and footer
         if len(lines) > 1:
-            body_lines = []
-            for line in lines[1:]:
-                # Check for breaking changes
-                for pattern in self.BREAKING_PATTERNS:
-                    breaking_match = pattern.match(line)
-                    if breaking_match:
+            # Check if commit type has ! suffix (alternative breaking change notation)
+            if lines[0].find('!:') > -1:
+                commit.breaking = True
+
+            commit.body = '\n'.join(lines[1:]).strip()
+
+        # Literal gate first: no candidate substring means the combined
+        # pattern cannot match, so the scan is skipped entirely
+        msg_lower = message.lower()
+        if any(lit in msg_lower for lit in _COMBINED_GATE_LITERALS):
+            # Single pass over the message for breaking changes and issue
+            # references; each match reports which alternative fired via
+            # lastgroup
+            header_end = message.find(lines[0]) + len(lines[0])
+            issues = set()
+            for m in _COMBINED_PATTERN.finditer(message):
+                if m.lastgroup == 'breaking':
+                    # Breaking footers only count in the body, never the header
+                    if m.start() > header_end:
                         commit.breaking = True
-                        commit.breaking_description = breaking_match.group(1)
-                        continue
-                        
-                # Check if commit type has ! suffix (alternative breaking change notation)
-                if lines[0].find('!:') > -1:
-                    commit.breaking = True
-                    
-                body_lines.append(line)
-                
-            commit.body = '\n'.join(body_lines).strip()
-        
-        # Extract issue references from entire message
-        for pattern in self.ISSUE_PATTERNS:
-            issues = pattern.findall(message)
-            commit.issues.extend(issues)
-            
-        # Remove duplicates
-        commit.issues = list(set(commit.issues))
-        
+                        commit.breaking_description = m.group('breaking')
+                else:
+                    issues.add(m.group(m.lastgroup))
+
+            # Sorted for deterministic output; list(set(...)) varied with
+            # the per-process hash seed
+            commit.issues = sorted(issues)
+
         return commit
 
 
+class _GitCatFileBatch:
+    """Request/response wrapper over a persistent 'git cat-file --batch'.
+
+    One process serves any number of object lookups over its pipes, so
+    per-object metadata reads cost a pipe round-trip instead of a
+    fork/exec. Obtained via GitLogReader.batch().
+    """
+
+    def __init__(self, proc: subprocess.Popen):
+        self._proc = proc
+
+    def _request(self, name: str) -> Optional[bytes]:
+        """Fetch one object's payload, or None if it doesn't exist."""
+        proc = self._proc
+        proc.stdin.write(f'{name}\n'.encode('utf-8'))
+        proc.stdin.flush()
+
+        # Response header: '<sha> <type> <size>' or '<name> missing'
+        header = proc.stdout.readline().decode('utf-8', 'replace').rstrip('\n')
+        if not header or header.endswith(' missing'):
+            return None
+
+        size = int(header.rsplit(' ', 1)[1])
+        payload = proc.stdout.read(size)
+        proc.stdout.read(1)  # trailing newline after the payload
+        return payload
+
+    def show(self, sha: str, path: str) -> Optional[bytes]:
+        """Return the contents of a file at a given commit, or None."""
+        return self._request(f'{sha}:{path}')
+
+    def commit_info(self, sha: str) -> Optional[str]:
+        """Return the raw commit object (headers + message), or None."""
+        payload = self._request(sha)
+        if payload is None:
+            return None
+        return payload.decode('utf-8', 'replace')
+
+
 class GitLogReader:
     """Read and parse git log."""
     
     def __init__(self, repo_path: Path):
         self.repo_path = repo_path
-        
-    def get_tags(self) -> List[Tuple[str, str]]:
-        """Get all tags with their commit SHAs."""
+        # Memoized git log results, keyed by (from_ref, to_ref)
+        self._commit_cache: Dict[Tuple[Optional[str], str], List[Dict[str, str]]] = {}
+
+    def get_tags(self) -> List[Tuple[str, str, str]]:
+        """Get all tags as (name, commit SHA, author date), newest first.
+
+        One for-each-ref call fetches the dates alongside the SHAs, so no
+        per-tag subprocess is needed later. %(*field) reads through
+        annotated tag objects to the tagged commit; plain %(field) covers
+        lightweight tags.
+        """
+        peeled_sha = '%(if)%(*objectname)%(then)%(*objectname)%(else)%(objectname)%(end)'
+        peeled_date = ('%(if)%(*authordate:iso-strict)%(then)%(*authordate:iso-strict)'
+                       '%(else)%(authordate:iso-strict)%(end)')
         try:
             result = subprocess.run(
-                ['git', 'tag', '--sort=-version:refname', '--format=%(refname:short) %(objectname)'],
+                ['git', 'for-each-ref', '--sort=-version:refname',
+                 f'--format=%(refname:short)%1f{peeled_sha}%1f{peeled_date}',
+                 'refs/tags'],
                 cwd=self.repo_path,
                 capture_output=True,
                 text=True,
                 check=True
             )
-            
+
             tags = []
             for line in result.stdout.strip().split('\n'):
                 if line:
-                    parts = line.split(' ')
-                    if len(parts) == 2:
-                        tags.append((parts[0], parts[1]))
-                        
+                    parts = line.split('\x1f')
+                    if len(parts) == 3:
+                        tags.append((parts[0], parts[1], parts[2]))
+
             return tags
-            
+
         except subprocess.CalledProcessError:
             return []
             
-    def get_commits(self, from_ref: Optional[str] = None, 
-                   to_ref: str = 'HEAD') -> List[Dict[str, str]]:
-        """Get commits between two refs."""
-        # Build git log command
-        cmd = ['git', 'log', '--pretty=format:%H%n%an%n%aI%n%s%n%b%n==END==']
-        
+    @staticmethod
+    def _parse_record(entry: str) -> Optional[Dict[str, str]]:
+        """Parse one \\x1f-delimited git log record into a commit dict."""
+        # maxsplit keeps any stray \x1f inside the body intact
+        fields = entry.split('\x1f', 5)
+        if len(fields) != 6:
+            return None
+
+        sha, parents, author, date, subject, body = fields
+        # Reconstruct the full message including body
+        return {
+            'sha': sha,
+            'parents': parents,
+            'author': author,
+            'date': date,
+            'message': f'{subject}\n{body}'.strip()
+        }
+
+    def iter_commits(self, from_ref: Optional[str] = None,
+                     to_ref: str = 'HEAD') -> Iterator[Dict[str, str]]:
+        """Stream commits between two refs as they arrive from git.
+
+        Commits are yielded record by record from the pipe, so peak memory
+        stays at one record instead of the whole log, and parsing overlaps
+        with git's own I/O. Raises CalledProcessError if git exits non-zero.
+        """
+        # Build git log command. Records are NUL-separated (-z) with \x1f
+        # between fields: unambiguous even if a body contains the old
+        # ==END== sentinel, and split('\x00') is a single-byte memchr scan
+        # instead of a 7-character substring search. %P carries the parent
+        # SHAs so tag-range bucketing can compute reachability in Python.
+        cmd = ['git', 'log', '-z', '--pretty=format:%H%x1f%P%x1f%an%x1f%aI%x1f%s%x1f%b']
+
         if from_ref:
             cmd.append(f'{from_ref}..{to_ref}')
         else:
             cmd.append(to_ref)
-            
+
+        proc = subprocess.Popen(
+            cmd,
+            cwd=self.repo_path,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True
+        )
+
         try:
-            result = subprocess.run(
-                cmd,
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            
-            commits = []
-            entries = result.stdout.strip().split('\n==END==\n')
-            
-            for entry in entries:
-                if not entry.strip():
+            buf = ''
+            for chunk in iter(lambda: proc.stdout.read(1 << 16), ''):
+                buf += chunk
+                if '\x00' not in chunk:
                     continue
-                    
-                lines = entry.strip().split('\n')
-                if len(lines) >= 4:
-                    # Reconstruct the full message including body
-                    message_lines = lines[3:]
-                    message = '\n'.join(message_lines).strip()
-                    
-                    commits.append({
-                        'sha': lines[0],
-                        'author': lines[1],
-                        'date': lines[2],
-                        'message': message
-                    })
-                    
-            return commits
-            
+                records = buf.split('\x00')
+                buf = records.pop()  # trailing partial record
+                for record in records:
+                    commit = self._parse_record(record)
+                    if commit:
+                        yield commit
+
+            # Last record has no trailing NUL
+            if buf.strip():
+                commit = self._parse_record(buf)
+                if commit:
+                    yield commit
+        finally:
+            proc.stdout.close()
+            returncode = proc.wait()
+
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, cmd)
+
+    def get_commits(self, from_ref: Optional[str] = None,
+                   to_ref: str = 'HEAD') -> List[Dict[str, str]]:
+        """Get commits between two refs."""
+        cache_key = (from_ref, to_ref)
+        cached = self._commit_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            commits = list(self.iter_commits(from_ref, to_ref))
         except subprocess.CalledProcessError as e:
             click.echo(f"Error reading git log: {e}", err=True)
             return []
-            
+
+        self._commit_cache[cache_key] = commits
+        return commits
+
+    def get_all_commits_with_refs(self, tags: List[Tuple[str, str, str]]) -> Dict[Optional[str], List[Dict[str, str]]]:
+        """Bucket every commit reachable from HEAD into tag ranges.
+
+        One ``git log HEAD`` supplies the commits plus their parent edges,
+        and reachability per tag is computed in Python, so each release
+        bucket holds exactly the commits of ``git log older..tag`` -
+        correct for merge histories, not just linear ones - without one
+        subprocess per range. Cost is O(tags x commits) set work in memory.
+
+        Tags not reachable from HEAD can't be resolved from the single
+        walk (their subgraphs never appear in it), so that rare case falls
+        back to one ``git log`` per range.
+        """
+        commits = self.get_commits()
+        by_sha = {c['sha']: c for c in commits}
+
+        if any(sha not in by_sha for _, sha, _ in tags):
+            buckets: Dict[Optional[str], List[Dict[str, str]]] = {
+                None: self.get_commits(tags[0][0]) if tags else list(commits)
+            }
+            for i, (tag, _, _) in enumerate(tags):
+                from_tag = tags[i + 1][0] if i + 1 < len(tags) else None
+                buckets[tag] = self.get_commits(from_tag, tag)
+            return buckets
+
+        def reachable(start: str) -> Set[str]:
+            seen: Set[str] = set()
+            stack = [start]
+            while stack:
+                sha = stack.pop()
+                # Unknown parents (e.g. shallow-clone boundaries) end the walk
+                if sha in seen or sha not in by_sha:
+                    continue
+                seen.add(sha)
+                stack.extend(by_sha[sha]['parents'].split())
+            return seen
+
+        # Newest-first, mirroring the tag list
+        reach = [reachable(sha) for _, sha, _ in tags]
+
+        # Unreleased = reachable from HEAD but not from the newest tag;
+        # release i = reachable from tag i but not from tag i+1. Buckets
+        # keep the global log order, as the per-range git log calls did.
+        newest = reach[0] if reach else ()
+        buckets = {None: [c for c in commits if c['sha'] not in newest]}
+
+        for i, (tag, _, _) in enumerate(tags):
+            newer = reach[i]
+            older = reach[i + 1] if i + 1 < len(tags) else ()
+            buckets[tag] = [
+                c for c in commits
+                if c['sha'] in newer and c['sha'] not in older
+            ]
+
+        return buckets
+
+    @contextmanager
+    def batch(self) -> Iterator[_GitCatFileBatch]:
+        """Open a persistent cat-file session for per-object lookups.
+
+        Usage::
+
+            with reader.batch() as batch:
+                for sha in shas:
+                    info = batch.commit_info(sha)
+
+        Each call owns its own git process, so concurrent builders simply
+        open separate sessions. The process is torn down on exit.
+        """
+        proc = subprocess.Popen(
+            ['git', 'cat-file', '--batch'],
+            cwd=self.repo_path,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL
+        )
+        try:
+            yield _GitCatFileBatch(proc)
+        finally:
+            proc.stdin.close()
+            proc.stdout.close()
+            proc.wait()
+
     def get_remote_url(self) -> Optional[str]:
         """Get the remote repository URL."""
         try:
@@ -221,6 +428,22 @@ class ChangelogBuilder:
         self.parser = ConventionalCommitParser()
         self.git_reader = GitLogReader(repo_path)
         self.repo_url = repo_url or self._detect_repo_url()
+        # Parse results keyed by SHA so a commit seen in several ranges
+        # (unreleased vs. release, markdown vs. JSON) is parsed once
+        self._parsed_commits: Dict[str, Optional[Commit]] = {}
+
+        # Link formatters specialized once here, so the repo_url branch is
+        # not re-evaluated for every commit and issue rendered
+        repo_url = self.repo_url
+        if repo_url:
+            self._commit_link = lambda sha: f"[{sha[:7]}]({repo_url}/commit/{sha})"
+            self._issue_link = lambda issue: (
+                f"[#{issue}]({repo_url}/issues/{issue})" if issue.isdigit()
+                else f"#{issue}"
+            )
+        else:
+            self._commit_link = lambda sha: sha[:7]
+            self._issue_link = lambda issue: f"#{issue}"
         
     def _detect_repo_url(self) -> Optional[str]:
         """Detect repository URL from git remote."""
@@ -235,251 +458,218 @@ class ChangelogBuilder:
         
     def _format_commit_link(self, sha: str) -> str:
         """Format a commit SHA as a link if repo URL is available."""
-        short_sha = sha[:7]
-        if self.repo_url:
-            return f"[{short_sha}]({self.repo_url}/commit/{sha})"
-        return short_sha
-        
+        return self._commit_link(sha)
+
     def _format_issue_link(self, issue: str) -> str:
         """Format an issue number as a link if repo URL is available."""
-        if self.repo_url and issue.isdigit():
-            return f"[#{issue}]({self.repo_url}/issues/{issue})"
-        return f"#{issue}"
+        return self._issue_link(issue)
         
-    def build_changelog(self, from_tag: Optional[str] = None, 
+    def _parse_commits(self, commits_data: List[Dict[str, str]]) -> List[Commit]:
+        """Parse raw commit dicts into Commit objects, dropping unparseable ones."""
+        commits = []
+        for data in commits_data:
+            sha = data['sha']
+            if sha in self._parsed_commits:
+                commit = self._parsed_commits[sha]
+            else:
+                try:
+                    date = datetime.fromisoformat(data['date'].replace('Z', '+00:00'))
+                except:
+                    date = datetime.now()
+
+                commit = self.parser.parse(
+                    sha=sha,
+                    message=data['message'],
+                    author=data['author'],
+                    date=date
+                )
+                self._parsed_commits[sha] = commit
+
+            if commit:
+                commits.append(commit)
+
+        return commits
+
+    def build_changelog(self, from_tag: Optional[str] = None,
                        to_ref: str = 'HEAD',
                        include_all: bool = False) -> str:
         """Build changelog for commits between tags/refs."""
-        # Get commits
         commits_data = self.git_reader.get_commits(from_tag, to_ref)
-        
-        # Parse commits
-        commits = []
-        for data in commits_data:
-            try:
-                date = datetime.fromisoformat(data['date'].replace('Z', '+00:00'))
-            except:
-                date = datetime.now()
-                
-            commit = self.parser.parse(
-                sha=data['sha'],
-                message=data['message'],
-                author=data['author'],
-                date=date
-            )
-            
-            if commit and (include_all or commit.type in self.parser.COMMIT_TYPES):
-                commits.append(commit)
-                
+        return self._render_changelog(commits_data, include_all)
+
+    def _render_changelog(self, commits_data: List[Dict[str, str]],
+                          include_all: bool = False) -> str:
+        """Render a changelog section from raw commit dicts."""
+        return '\n'.join(self._iter_changelog_lines(commits_data, include_all))
+
+    def _iter_changelog_lines(self, commits_data: List[Dict[str, str]],
+                              include_all: bool = False) -> Iterator[str]:
+        """Yield changelog lines (newline-free) for raw commit dicts."""
+        commits = [
+            commit for commit in self._parse_commits(commits_data)
+            if include_all or commit.type in self.parser.COMMIT_TYPE_SET
+        ]
+
         if not commits:
-            return "No conventional commits found in the specified range.\n"
-            
-        # Group commits by type
-        grouped = defaultdict(list)
+            yield "No conventional commits found in the specified range.\n"
+            return
+
+        # Group commits by type. Buckets are pre-seeded for the known types
+        # so the per-commit append never pays a hash-miss/new-list path;
+        # unknown types (admitted by include_all) are collected separately
+        # and, as with the old defaultdict, never get a rendered section.
+        grouped: Dict[str, List[Commit]] = {t: [] for t in self.parser.COMMIT_TYPES}
+        extra: List[Commit] = []
         breaking_changes = []
-        
+
         for commit in commits:
             if commit.breaking:
                 breaking_changes.append(commit)
-            grouped[commit.type].append(commit)
-            
-        # Build changelog
-        lines = []
-        
+            bucket = grouped.get(commit.type)
+            (bucket if bucket is not None else extra).append(commit)
+
         # Add breaking changes section if any
         if breaking_changes:
-            lines.append("### ⚠ BREAKING CHANGES\n")
+            yield "### ⚠ BREAKING CHANGES\n"
             for commit in breaking_changes:
                 desc = commit.breaking_description or commit.description
-                lines.append(f"* {desc}")
+                yield f"* {desc}"
                 if commit.scope:
-                    lines.append(f"  * Scope: {commit.scope}")
-                lines.append(f"  * Commit: {self._format_commit_link(commit.sha)}")
-                lines.append("")
-                
+                    yield f"  * Scope: {commit.scope}"
+                yield f"  * Commit: {self._commit_link(commit.sha)}"
+                yield ""
+
         # Add sections for each commit type
         for commit_type, display_name in self.parser.COMMIT_TYPES.items():
-            if commit_type in grouped and grouped[commit_type]:
-                lines.append(f"### {display_name}\n")
-                
+            if grouped[commit_type]:
+                yield f"### {display_name}\n"
+
                 # Group by scope within type
                 by_scope = defaultdict(list)
                 no_scope = []
-                
+
                 for commit in grouped[commit_type]:
                     if commit.scope:
                         by_scope[commit.scope].append(commit)
                     else:
                         no_scope.append(commit)
-                        
+
                 # Format commits with scope
                 for scope in sorted(by_scope.keys()):
-                    lines.append(f"* **{scope}**")
+                    yield f"* **{scope}**"
                     for commit in by_scope[scope]:
-                        lines.append(f"  * {commit.description} ({self._format_commit_link(commit.sha)})")
+                        yield f"  * {commit.description} ({self._commit_link(commit.sha)})"
                         if commit.issues:
-                            issues = ', '.join(self._format_issue_link(issue) for issue in commit.issues)
-                            lines.append(f"    * Issues: {issues}")
-                            
+                            issues = ', '.join(self._issue_link(issue) for issue in commit.issues)
+                            yield f"    * Issues: {issues}"
+
                 # Format commits without scope
                 for commit in no_scope:
-                    lines.append(f"* {commit.description} ({self._format_commit_link(commit.sha)})")
+                    yield f"* {commit.description} ({self._commit_link(commit.sha)})"
                     if commit.issues:
-                        issues = ', '.join(self._format_issue_link(issue) for issue in commit.issues)
-                        lines.append(f"  * Issues: {issues}")
-                        
-                lines.append("")
-                
-        return '\n'.join(lines)
+                        issues = ', '.join(self._issue_link(issue) for issue in commit.issues)
+                        yield f"  * Issues: {issues}"
+
+                yield ""
         
     def build_full_changelog(self, output_format: str = 'markdown') -> str:
         """Build a full changelog with all releases."""
-        tags = self.git_reader.get_tags()
-        
         if output_format == 'json':
-            return self._build_json_changelog(tags)
-            
-        # Markdown format
-        lines = []
-        lines.append("# Changelog\n")
-        lines.append("All notable changes to this project will be documented in this file.\n")
-        lines.append("The format is based on [Keep a Changelog](https://keepachangelog.com/en/1.0.0/),")
-        lines.append("and this project adheres to [Semantic Versioning](https://semver.org/spec/v2.0.0.html).\n")
-        
+            return self._build_json_changelog(self.git_reader.get_tags())
+
+        return '\n'.join(self._iter_full_changelog_lines())
+
+    def _iter_full_changelog_lines(self) -> Iterator[str]:
+        """Yield markdown lines (newline-free) for the full changelog."""
+        tags = self.git_reader.get_tags()
+
+        # One git log for the whole history instead of one per release
+        buckets = self.git_reader.get_all_commits_with_refs(tags) if tags else {}
+
+        yield "# Changelog\n"
+        yield "All notable changes to this project will be documented in this file.\n"
+        yield "The format is based on [Keep a Changelog](https://keepachangelog.com/en/1.0.0/),"
+        yield "and this project adheres to [Semantic Versioning](https://semver.org/spec/v2.0.0.html).\n"
+
         # Add unreleased section if there are commits after the last tag
         if tags:
-            unreleased = self.build_changelog(from_tag=tags[0][0], to_ref='HEAD')
+            unreleased = self._render_changelog(buckets[None])
             if unreleased.strip() and unreleased != "No conventional commits found in the specified range.\n":
-                lines.append("## [Unreleased]\n")
-                lines.append(unreleased)
-                
-        # Add sections for each release
-        for i, (tag, _) in enumerate(tags):
-            # Get the date of the tag
+                yield "## [Unreleased]\n"
+                yield unreleased
+
+        # Add sections for each release; tag dates came with get_tags, so
+        # no per-tag subprocess is spawned here
+        for tag, _, iso_date in tags:
             try:
-                result = subprocess.run(
-                    ['git', 'log', '-1', '--format=%aI', tag],
-                    cwd=self.repo_path,
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
-                date_str = result.stdout.strip()
-                date = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+                date = datetime.fromisoformat(iso_date.replace('Z', '+00:00'))
                 date_formatted = date.strftime('%Y-%m-%d')
             except:
                 date_formatted = 'Unknown'
-                
-            lines.append(f"## [{tag}] - {date_formatted}\n")
-            
-            # Get commits for this release
-            from_tag = tags[i + 1][0] if i + 1 < len(tags) else None
-            changelog = self.build_changelog(from_tag=from_tag, to_ref=tag)
-            lines.append(changelog)
-            
+
+            yield f"## [{tag}] - {date_formatted}\n"
+
+            # Commits for this release come out of the single-walk buckets
+            yield from self._iter_changelog_lines(buckets.get(tag, []))
+
         # Add links section
         if self.repo_url and tags:
-            lines.append("\n")
-            lines.append("[Unreleased]: " + 
-                        f"{self.repo_url}/compare/{tags[0][0]}...HEAD")
-            
-            for i, (tag, _) in enumerate(tags):
+            yield "\n"
+            yield ("[Unreleased]: " +
+                   f"{self.repo_url}/compare/{tags[0][0]}...HEAD")
+
+            for i, (tag, _, _) in enumerate(tags):
                 if i + 1 < len(tags):
                     prev_tag = tags[i + 1][0]
-                    lines.append(f"[{tag}]: {self.repo_url}/compare/{prev_tag}...{tag}")
+                    yield f"[{tag}]: {self.repo_url}/compare/{prev_tag}...{tag}"
                 else:
-                    lines.append(f"[{tag}]: {self.repo_url}/releases/tag/{tag}")
-                    
-        return '\n'.join(lines)
+                    yield f"[{tag}]: {self.repo_url}/releases/tag/{tag}"
         
-    def _build_json_changelog(self, tags: List[Tuple[str, str]]) -> str:
+    @staticmethod
+    def _commit_as_dict(commit: Commit) -> Dict:
+        """Serialize a Commit for the JSON changelog."""
+        return {
+            'sha': commit.sha,
+            'type': commit.type,
+            'scope': commit.scope,
+            'description': commit.description,
+            'breaking': commit.breaking,
+            'issues': commit.issues,
+            'author': commit.author,
+            'date': commit.date.isoformat()
+        }
+
+    def _build_json_changelog(self, tags: List[Tuple[str, str, str]]) -> str:
         """Build changelog in JSON format."""
         releases = []
-        
+
+        # One git log for the whole history instead of one per release
+        buckets = self.git_reader.get_all_commits_with_refs(tags) if tags else {}
+
         # Add unreleased section
         if tags:
-            commits_data = self.git_reader.get_commits(from_tag=tags[0][0], to_ref='HEAD')
-            unreleased_commits = []
-            
-            for data in commits_data:
-                try:
-                    date = datetime.fromisoformat(data['date'].replace('Z', '+00:00'))
-                except:
-                    date = datetime.now()
-                    
-                commit = self.parser.parse(
-                    sha=data['sha'],
-                    message=data['message'],
-                    author=data['author'],
-                    date=date
-                )
-                
-                if commit:
-                    unreleased_commits.append({
-                        'sha': commit.sha,
-                        'type': commit.type,
-                        'scope': commit.scope,
-                        'description': commit.description,
-                        'breaking': commit.breaking,
-                        'issues': commit.issues,
-                        'author': commit.author,
-                        'date': commit.date.isoformat()
-                    })
-                    
+            unreleased_commits = [
+                self._commit_as_dict(commit)
+                for commit in self._parse_commits(buckets[None])
+            ]
+
             if unreleased_commits:
                 releases.append({
                     'version': 'unreleased',
                     'date': None,
                     'commits': unreleased_commits
                 })
-                
-        # Add tagged releases
-        for i, (tag, sha) in enumerate(tags):
-            from_tag = tags[i + 1][0] if i + 1 < len(tags) else None
-            commits_data = self.git_reader.get_commits(from_tag=from_tag, to_ref=tag)
-            
-            release_commits = []
-            for data in commits_data:
-                try:
-                    date = datetime.fromisoformat(data['date'].replace('Z', '+00:00'))
-                except:
-                    date = datetime.now()
-                    
-                commit = self.parser.parse(
-                    sha=data['sha'],
-                    message=data['message'],
-                    author=data['author'],
-                    date=date
-                )
-                
-                if commit:
-                    release_commits.append({
-                        'sha': commit.sha,
-                        'type': commit.type,
-                        'scope': commit.scope,
-                        'description': commit.description,
-                        'breaking': commit.breaking,
-                        'issues': commit.issues,
-                        'author': commit.author,
-                        'date': commit.date.isoformat()
-                    })
-                    
-            # Get release date
-            try:
-                result = subprocess.run(
-                    ['git', 'log', '-1', '--format=%aI', tag],
-                    cwd=self.repo_path,
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
-                release_date = result.stdout.strip()
-            except:
-                release_date = None
-                
+
+        # Add tagged releases; dates came with get_tags
+        for tag, _, iso_date in tags:
+            release_commits = [
+                self._commit_as_dict(commit)
+                for commit in self._parse_commits(buckets.get(tag, []))
+            ]
+
             releases.append({
                 'version': tag,
-                'date': release_date,
+                'date': iso_date or None,
                 'commits': release_commits
             })
             
@@ -533,7 +723,10 @@ def main(path, from_ref, to_ref, output_format, output, include_all, repo_url):
         
     # Build changelog
     builder = ChangelogBuilder(repo_path, repo_url)
-    
+
+    output_content = None
+    line_stream = None
+
     if from_ref:
         # Generate changelog for specific range
         output_content = builder.build_changelog(
@@ -541,7 +734,7 @@ def main(path, from_ref, to_ref, output_format, output, include_all, repo_url):
             to_ref=to_ref,
             include_all=include_all
         )
-        
+
         if output_format == 'json':
             # Wrap in JSON structure
             output_content = json.dumps({
@@ -549,14 +742,21 @@ def main(path, from_ref, to_ref, output_format, output, include_all, repo_url):
                 'to': to_ref,
                 'changelog': output_content
             }, indent=2)
+    elif output and output_format == 'markdown':
+        # Stream lines straight into the file without materializing the
+        # whole changelog in memory
+        line_stream = builder._iter_full_changelog_lines()
     else:
         # Generate full changelog
         output_content = builder.build_full_changelog(output_format)
-        
+
     # Output results
     if output:
         with open(output, 'w', encoding='utf-8') as f:
-            f.write(output_content)
+            if line_stream is not None:
+                f.writelines(_newline_separated(line_stream))
+            else:
+                f.write(output_content)
         click.echo(f"Changelog saved to {output}", err=True)
     else:
         click.echo(output_content)